@@ -25,26 +25,69 @@ import threading
 import time
 import logging
 import json
+import functools
 import signal
 import sys
 import struct
 import configparser
 import os
 import argparse
-from datetime import datetime
-from typing import Dict, Any, Optional
+from collections import defaultdict
+from typing import Callable, Dict, Any, Optional
 
 # Constants
 MAX_BUFFER_SIZE = 512
 BUFFER_CLEANUP_SIZE = 256
+RECV_BUFFER_SIZE = 8192
+RECV_CHUNK_SIZE = 1024
 MIN_FRAME_SIZE = 4
 MAX_FRAME_SIZE = 256
-TEMPERATURE_MIN = -30
-TEMPERATURE_MAX = 150
+TEMPERATURE_MIN = -30.0
+TEMPERATURE_MAX = 150.0
 MODBUS_CRC_INIT = 0xFFFF
 MODBUS_CRC_POLY = 0xA001
 STATS_PUBLISH_INTERVAL = 50
 
+def _build_crc16_table():
+    """Precompute the 256-entry Modbus CRC16 lookup table at import time
+
+    Returned as a tuple: indexing a tuple hands back the cached int object
+    directly, while array('H') boxes a new int on every lookup, which adds
+    up in the per-byte CRC loop of the pure Python fallback.
+    """
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            if crc & 0x0001:
+                crc = (crc >> 1) ^ MODBUS_CRC_POLY
+            else:
+                crc >>= 1
+        table.append(crc)
+    return tuple(table)
+
+CRC16_TABLE = _build_crc16_table()
+
+def _build_crc16_nibble_table():
+    """Precompute the 16-entry (32-byte) Modbus CRC16 nibble table"""
+    table = []
+    for nibble in range(16):
+        crc = nibble
+        for _ in range(4):
+            if crc & 0x0001:
+                crc = (crc >> 1) ^ MODBUS_CRC_POLY
+            else:
+                crc >>= 1
+        table.append(crc)
+    return tuple(table)
+
+CRC16_NIBBLE_TABLE = _build_crc16_nibble_table()
+
+# The nibble table trades two lookups per byte for a table that fits in a
+# single cache line; worthwhile on cache-constrained hosts where the
+# 512-byte table competes with other hot data
+USE_NIBBLE_CRC_TABLE = False
+
 # Import required libraries
 try:
     import paho.mqtt.client as mqtt
@@ -52,6 +95,75 @@ try:
 except ImportError:
     MQTT_AVAILABLE = False
 
+# Optional NumPy support for vectorized buffer scanning
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional JIT-compiled CRC path (pure Python fallback below)
+try:
+    import numba
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Optional compiled hot loops; build with `python setup.py build_ext --inplace`
+try:
+    import _sniffer_core
+    SNIFFER_CORE_AVAILABLE = True
+except ImportError:
+    SNIFFER_CORE_AVAILABLE = False
+
+if NUMPY_AVAILABLE:
+    CRC16_TABLE_NP = np.array(CRC16_TABLE, dtype=np.uint16)
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True, boundscheck=False)
+    def _crc16_modbus(data):
+        crc = MODBUS_CRC_INIT
+        for i in range(data.shape[0]):
+            crc = (crc >> 8) ^ CRC16_TABLE_NP[(crc ^ data[i]) & 0xFF]
+        return crc
+
+    # Warm the JIT at startup so the first frame doesn't pay compile cost
+    _crc16_modbus(np.zeros(MIN_FRAME_SIZE, dtype=np.uint8))
+
+# Precompiled single-register unpacker, shared by the frame parsers
+_U16 = struct.Struct('>H')
+_u16 = _U16.unpack_from
+
+# Precompiled unpackers for runs of big-endian 16-bit registers, keyed by
+# register count; polls repeat the same counts so the cache hit rate is ~100%
+_REG_STRUCTS = {}
+
+def _unpack_regs(buf, offset, count):
+    """Unpack count big-endian 16-bit registers from buf in a single call"""
+    s = _REG_STRUCTS.get(count)
+    if s is None:
+        s = _REG_STRUCTS[count] = struct.Struct(f'>{count}H')
+    return s.unpack_from(buf, offset)
+
+_SLAVE_STAT_KEYS = ('total_frames', 'valid_frames', 'requests', 'responses', 'errors', 'mqtt_publishes')
+
+# Read functions (coils, discrete inputs, holding/input registers)
+_READ_FUNCTION_CODES = frozenset((0x01, 0x02, 0x03, 0x04))
+
+def _new_slave_stats():
+    """Factory for a zeroed per-slave counter dict"""
+    return dict.fromkeys(_SLAVE_STAT_KEYS, 0)
+
+# Icon rules for binary sensors, first substring match wins
+_ICON_RULES = (
+    ("alarm", "mdi:alert"),
+    ("fan", "mdi:fan"),
+    ("heater", "mdi:radiator"),
+    ("valve", "mdi:valve"),
+    ("pump", "mdi:pump"),
+    ("defrost", "mdi:snowflake"),
+)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -84,7 +196,15 @@ class HomeAssistantMQTT:
         
         # Track device info for each slave ID
         self.device_infos = {}
+        self.device_info_json = {}
         self.discovered_slaves = set()
+
+        # Pre-built state topics keyed by (slave_id, sensor_name)
+        self._state_topic_cache = {}
+
+        # Combined per-slave JSON state (one publish per response frame)
+        self._bundle_topic_cache = {}
+        self._bundle_state = {}
         
         if MQTT_AVAILABLE:
             self.setup_mqtt()
@@ -120,36 +240,51 @@ class HomeAssistantMQTT:
         self.connected = False
         logger.warning("🏠 Disconnected from MQTT broker")
     
-    def _sanitize_sensor_name(self, sensor_name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _sanitize_sensor_name(sensor_name: str) -> str:
         """Convert sensor name to topic-safe format"""
         return sensor_name.lower().replace(' ', '_').replace('-', '_').replace('/', '_')
     
-    def publish_sensor_discovery(self, sensor_name: str, slave_id: int, unit: str = None, 
-                                device_class: str = None, icon: str = None):
+    def _get_bundle_topic(self, slave_id: int) -> str:
+        """Get the combined JSON state topic for a slave"""
+        topic = self._bundle_topic_cache.get(slave_id)
+        if topic is None:
+            topic = f"{self.device_prefix}/bundle/{slave_id:02x}/state"
+            self._bundle_topic_cache[slave_id] = topic
+        return topic
+
+    def publish_sensor_discovery(self, sensor_name: str, slave_id: int, unit: str = None,
+                                device_class: str = None, icon: str = None, bundled: bool = True):
         """Publish Home Assistant sensor discovery configuration"""
         if not self.connected:
             return
-        
+
         # Include slave ID in sensor naming
-        sensor_id = f"{self.device_prefix}_{slave_id:02x}_{self._sanitize_sensor_name(sensor_name)}"
+        sanitized_name = self._sanitize_sensor_name(sensor_name)
+        sensor_id = f"{self.device_prefix}_{slave_id:02x}_{sanitized_name}"
         config_topic = f"{self.discovery_prefix}/sensor/{sensor_id}/config"
-        state_topic = f"{self.device_prefix}/sensor/{slave_id:02x}_{self._sanitize_sensor_name(sensor_name)}/state"
-        
+
         config = {
             "name": sensor_name,
-            "unique_id": sensor_id,
-            "state_topic": state_topic,
-            "device": self.get_device_info(slave_id)
+            "unique_id": sensor_id
         }
-        
+
+        if bundled:
+            # Sensor reads its value out of the combined JSON state message
+            config["state_topic"] = self._get_bundle_topic(slave_id)
+            config["value_template"] = f"{{{{ value_json['{sanitized_name}'] }}}}"
+        else:
+            config["state_topic"] = f"{self.device_prefix}/sensor/{slave_id:02x}_{sanitized_name}/state"
+
         if unit:
             config["unit_of_measurement"] = unit
         if device_class:
             config["device_class"] = device_class
         if icon:
             config["icon"] = icon
-        
-        self.client.publish(config_topic, json.dumps(config), retain=True)
+
+        self.client.publish(config_topic, self._render_discovery_config(config, slave_id), retain=True)
         logger.debug(f"📡 Published sensor discovery for {sensor_name} on device {slave_id:02X}")
     
     def publish_binary_sensor_discovery(self, sensor_name: str, slave_id: int, icon: str = None):
@@ -158,15 +293,15 @@ class HomeAssistantMQTT:
             return
         
         # Include slave ID in sensor naming
-        sensor_id = f"{self.device_prefix}_{slave_id:02x}_{self._sanitize_sensor_name(sensor_name)}"
+        sanitized_name = self._sanitize_sensor_name(sensor_name)
+        sensor_id = f"{self.device_prefix}_{slave_id:02x}_{sanitized_name}"
         config_topic = f"{self.discovery_prefix}/binary_sensor/{sensor_id}/config"
-        state_topic = f"{self.device_prefix}/binary_sensor/{slave_id:02x}_{self._sanitize_sensor_name(sensor_name)}/state"
-        
+
         config = {
             "name": sensor_name,
             "unique_id": sensor_id,
-            "state_topic": state_topic,
-            "device": self.get_device_info(slave_id),
+            "state_topic": self._get_bundle_topic(slave_id),
+            "value_template": f"{{{{ value_json['{sanitized_name}'] }}}}",
             "payload_on": "True",
             "payload_off": "False"
         }
@@ -176,38 +311,70 @@ class HomeAssistantMQTT:
         
         # Set appropriate icon based on sensor type
         sensor_lower = sensor_name.lower()
-        if "alarm" in sensor_lower:
-            config["icon"] = "mdi:alert"
-        elif "fan" in sensor_lower:
-            config["icon"] = "mdi:fan"
-        elif "heater" in sensor_lower:
-            config["icon"] = "mdi:radiator"
-        elif "valve" in sensor_lower:
-            config["icon"] = "mdi:valve"
-        elif "pump" in sensor_lower:
-            config["icon"] = "mdi:pump"
-        elif "defrost" in sensor_lower:
-            config["icon"] = "mdi:snowflake"
-        
-        self.client.publish(config_topic, json.dumps(config), retain=True)
+        for keyword, rule_icon in _ICON_RULES:
+            if keyword in sensor_lower:
+                config["icon"] = rule_icon
+                break
+
+        self.client.publish(config_topic, self._render_discovery_config(config, slave_id), retain=True)
         logger.debug(f"📡 Published binary sensor discovery for {sensor_name} on device {slave_id:02X}")
 
-    def publish_sensor_data(self, sensor_name: str, slave_id: int, value: Any):
-        """Publish sensor data to Home Assistant"""
+    def _sensor_state_topic(self, sensor_name: str, slave_id: int) -> str:
+        """Get the cached state topic for a non-bundled sensor"""
+        key = (slave_id, sensor_name)
+        state_topic = self._state_topic_cache.get(key)
+        if state_topic is None:
+            state_topic = f"{self.device_prefix}/sensor/{slave_id:02x}_{self._sanitize_sensor_name(sensor_name)}/state"
+            self._state_topic_cache[key] = state_topic
+        return state_topic
+
+    def publish_batch(self, messages):
+        """Publish a pre-collected batch of (topic, payload, qos, retain) messages
+
+        Callers queue messages into a list while they do their own work and
+        hand them over in one call. The publishes are appended to paho's
+        outgoing queue back to back, so the network thread drains them into
+        as few socket writes as possible instead of one wakeup per message.
+        """
         if not self.connected:
             return
-        
-        state_topic = f"{self.device_prefix}/sensor/{slave_id:02x}_{self._sanitize_sensor_name(sensor_name)}/state"
-        self.client.publish(state_topic, str(value))
-    
-    def publish_binary_sensor_data(self, sensor_name: str, slave_id: int, value: bool):
-        """Publish binary sensor data to Home Assistant"""
+
+        publish = self.client.publish
+        for topic, payload, qos, retain in messages:
+            publish(topic, payload, qos=qos, retain=retain)
+
+    def publish_sensor_bundle(self, slave_id: int, payload: Dict[str, Any]):
+        """Publish all sensor values for a slave as a single JSON state message
+
+        New values are merged into the last known state so every discovered
+        sensor keeps a value in each message, even when the poll that
+        triggered the publish only covered part of the register range.
+        """
         if not self.connected:
             return
-        
-        state_topic = f"{self.device_prefix}/binary_sensor/{slave_id:02x}_{self._sanitize_sensor_name(sensor_name)}/state"
-        self.client.publish(state_topic, "True" if value else "False")
-        
+
+        state = self._bundle_state.setdefault(slave_id, {})
+        state.update(payload)
+        # qos=0 / retain=False: a lost bundle is replaced by the next poll
+        # cycle; retaining would only serve stale data after a restart.
+        self.client.publish(self._get_bundle_topic(slave_id), json.dumps(state),
+                            qos=0, retain=False)
+
+
+    def _render_discovery_config(self, config: dict, slave_id: int) -> str:
+        """Serialize a discovery config, splicing in the cached device JSON
+
+        The device block is identical for every sensor of a slave, so it is
+        serialized once and concatenated in instead of being rebuilt and
+        re-encoded for each discovery message in the burst when a new slave
+        appears.
+        """
+        device_json = self.device_info_json.get(slave_id)
+        if device_json is None:
+            device_json = json.dumps(self.get_device_info(slave_id), separators=(',', ':'))
+            self.device_info_json[slave_id] = device_json
+        return json.dumps(config)[:-1] + ', "device": ' + device_json + '}'
+
     def get_device_info(self, slave_id: int) -> dict:
         """Get device info for a specific slave ID, creating if needed"""
         if slave_id not in self.device_infos:
@@ -246,11 +413,32 @@ class HomeAssistantMQTT:
             except Exception as e:
                 logger.warning(f"Error during MQTT shutdown: {e}")
 
+class RegSpec:
+    """Precomputed per-register metadata for the parsing hot loop
+
+    Explicit __slots__ rather than dataclass(slots=True), which needs
+    Python 3.10; the script supports 3.7+.
+    """
+    __slots__ = ('name', 'unit', 'scale', 'offset', 'device_class',
+                 'is_temp', 'transform', 'ha_key')
+
+    def __init__(self, name: str, unit: str, scale: float, offset: int,
+                 device_class: Optional[str], is_temp: bool,
+                 transform: Callable[[int], Any], ha_key: str):
+        self.name = name
+        self.unit = unit
+        self.scale = scale
+        self.offset = offset
+        self.device_class = device_class
+        self.is_temp = is_temp
+        self.transform = transform
+        self.ha_key = ha_key
+
 class QuattDataParser:
     """
     Parser for extracting meaningful data from Quatt heat pump registers.
     """
-    
+
     def __init__(self):
         # Quatt register mappings - Updated from M10tech/Quatt-sniffer v1.1.0
         self.register_mappings = {
@@ -312,58 +500,186 @@ class QuattDataParser:
             9: {"name": "Alarm - AC High/Low Voltage", "bitmask": 0x200},
             12: {"name": "Alarm - Low Pressure Switch", "bitmask": 0x1000},
         }
-    
+
+        # Specialized per-register specs so the hot loop avoids repeated
+        # dict indexing, .get defaults and string comparisons
+        self._spec_by_reg = {
+            register_addr: RegSpec(
+                name=mapping["name"],
+                unit=mapping["unit"],
+                scale=mapping["scale"],
+                offset=mapping.get("offset", 0),
+                device_class=mapping["device_class"],
+                is_temp=mapping["device_class"] == "temperature",
+                transform=self._compile_transform(
+                    mapping["scale"],
+                    mapping.get("offset", 0),
+                    mapping["device_class"] == "temperature",
+                ),
+                ha_key=HomeAssistantMQTT._sanitize_sensor_name(mapping["name"]),
+            )
+            for register_addr, mapping in self.register_mappings.items()
+        }
+
+        # Sanitized HA payload keys for the bit sensors, resolved once here
+        # instead of per publish in the hot loop
+        sanitize = HomeAssistantMQTT._sanitize_sensor_name
+        for prefix, bits in (("R2108", self.r2108_bits), ("R2119", self.r2119_bits)):
+            for bit_info in bits.values():
+                bit_info["key"] = sanitize(f"{prefix} {bit_info['name']}")
+        self._defrost_key = sanitize("Defrost Mode Active")
+
+        # Structure-of-arrays view of the mappings, indexed by register
+        # offset from the lowest mapped address, for vectorized parsing
+        self._min_reg = min(self.register_mappings)
+        self._max_reg = max(self.register_mappings)
+
+        # Dense spec list for the scalar loop: integer subtract + list
+        # index beats a dict lookup per register
+        self._specs = [None] * (self._max_reg - self._min_reg + 1)
+        for register_addr, spec in self._spec_by_reg.items():
+            self._specs[register_addr - self._min_reg] = spec
+        if NUMPY_AVAILABLE:
+            span = self._max_reg - self._min_reg + 1
+            self._np_valid = np.zeros(span, dtype=bool)
+            self._np_is_temp = np.zeros(span, dtype=bool)
+            self._np_scale = np.ones(span, dtype=np.float64)
+            self._np_offset = np.zeros(span, dtype=np.float64)
+            for register_addr, mapping in self.register_mappings.items():
+                idx = register_addr - self._min_reg
+                self._np_valid[idx] = True
+                self._np_is_temp[idx] = mapping["device_class"] == "temperature"
+                self._np_scale[idx] = mapping["scale"]
+                self._np_offset[idx] = mapping.get("offset", 0)
+
+    @staticmethod
+    def _compile_transform(scale, offset, is_temp):
+        """Generate a specialized scale/offset/clamp function for one register
+
+        The register's constants are folded into the generated source, so
+        the hot loop calls straight-line code with no spec lookups; the
+        no-op cases (offset 0, scale 1) disappear entirely.
+        """
+        if offset:
+            expr = f"(value + {offset!r}) * {scale!r}"
+        elif scale != 1:
+            expr = f"value * {scale!r}"
+        else:
+            expr = "value"
+
+        lines = ["def transform(value):", f"    value = {expr}"]
+        if is_temp:
+            lines += [
+                f"    if value < {TEMPERATURE_MIN!r}:",
+                f"        return {TEMPERATURE_MIN!r}",
+                f"    if value > {TEMPERATURE_MAX!r}:",
+                f"        return {TEMPERATURE_MAX!r}",
+            ]
+        lines.append("    return value")
+
+        namespace = {}
+        exec("\n".join(lines), namespace)
+        return namespace["transform"]
+
     def parse_read_response(self, start_register: int, values: list) -> Dict[str, Any]:
         """Parse read response and extract known sensor values with proper scaling and bit handling"""
+        if NUMPY_AVAILABLE and len(values):
+            return self._parse_read_response_np(start_register, values)
+
         parsed_data = {}
-        
+        min_reg = self._min_reg
+        specs = self._specs
+        span = len(specs)
+
         for i, value in enumerate(values):
             register_addr = start_register + i
-            
-            if register_addr not in self.register_mappings:
+
+            idx = register_addr - min_reg
+            if idx < 0 or idx >= span:
                 continue
-                
-            mapping = self.register_mappings[register_addr]
-            
+            spec = specs[idx]
+            if spec is None:
+                continue
+
             # Handle signed values for temperature readings
-            if mapping["device_class"] == "temperature" and value > 32767:
+            if spec.is_temp and value > 32767:
                 value = value - 65536  # Convert to signed 16-bit
-            
-            # Apply offset first, then scaling
-            offset_value = value + mapping.get("offset", 0)
-            scaled_value = offset_value * mapping["scale"]
-            
-            # Clamp temperature values to reasonable ranges
-            if mapping["device_class"] == "temperature":
-                scaled_value = max(TEMPERATURE_MIN, min(scaled_value, TEMPERATURE_MAX))
-            
-            parsed_data[mapping["name"]] = {
+
+            # Offset, scaling and clamping, specialized per register
+            scaled_value = spec.transform(value)
+
+            parsed_data[spec.name] = {
                 "value": scaled_value,
-                "unit": mapping["unit"],
-                "device_class": mapping["device_class"],
+                "unit": spec.unit,
+                "device_class": spec.device_class,
                 "register": register_addr,
-                "raw_value": value
+                "raw_value": value,
+                "key": spec.ha_key
             }
-            
+
             # Handle special bit registers
-            if register_addr == 2108:
-                self._parse_status_bits(parsed_data, value, register_addr, self.r2108_bits, "R2108")
-            elif register_addr == 2118:
-                # R2118 defrost mode (bit 0)
-                defrost_active = bool(value & 0x1)
-                parsed_data["Defrost Mode Active"] = {
-                    "value": defrost_active,
-                    "unit": "",
-                    "device_class": "binary_sensor", 
-                    "register": "2118b0",
-                    "raw_value": value
-                }
-            elif register_addr == 2119:
-                self._parse_status_bits(parsed_data, value, register_addr, self.r2119_bits, "R2119")
-        
+            self._parse_special_bits(parsed_data, register_addr, value)
+
         return parsed_data
 
-    def _parse_status_bits(self, parsed_data: dict, value: int, register_addr: int, 
+    def _parse_read_response_np(self, start_register: int, values: list) -> Dict[str, Any]:
+        """Vectorized parse_read_response over the structure-of-arrays mappings"""
+        parsed_data = {}
+
+        vals = np.asarray(values, dtype=np.int64)
+        registers = start_register + np.arange(len(vals))
+        in_range = (registers >= self._min_reg) & (registers <= self._max_reg)
+        indices = np.where(in_range, registers - self._min_reg, 0)
+        valid = in_range & self._np_valid[indices]
+
+        # Signed conversion, offset, scaling and clamping in one pass
+        is_temp = valid & self._np_is_temp[indices]
+        signed = np.where(is_temp & (vals > 32767), vals - 65536, vals)
+        scaled = (signed + self._np_offset[indices]) * self._np_scale[indices]
+        scaled = np.where(is_temp, np.clip(scaled, TEMPERATURE_MIN, TEMPERATURE_MAX), scaled)
+
+        # Only the known registers need the Python-level dict build
+        for i in np.nonzero(valid)[0]:
+            register_addr = int(registers[i])
+            spec = self._spec_by_reg[register_addr]
+            raw_value = int(signed[i])
+
+            scaled_value = float(scaled[i])
+            if spec.scale == 1:
+                scaled_value = int(scaled_value)
+
+            parsed_data[spec.name] = {
+                "value": scaled_value,
+                "unit": spec.unit,
+                "device_class": spec.device_class,
+                "register": register_addr,
+                "raw_value": raw_value,
+                "key": spec.ha_key
+            }
+
+            self._parse_special_bits(parsed_data, register_addr, raw_value)
+
+        return parsed_data
+
+    def _parse_special_bits(self, parsed_data: dict, register_addr: int, value: int):
+        """Expand the bit-field registers into individual binary sensors"""
+        if register_addr == 2108:
+            self._parse_status_bits(parsed_data, value, register_addr, self.r2108_bits, "R2108")
+        elif register_addr == 2118:
+            # R2118 defrost mode (bit 0)
+            defrost_active = bool(value & 0x1)
+            parsed_data["Defrost Mode Active"] = {
+                "value": defrost_active,
+                "unit": "",
+                "device_class": "binary_sensor",
+                "register": "2118b0",
+                "raw_value": value,
+                "key": self._defrost_key
+            }
+        elif register_addr == 2119:
+            self._parse_status_bits(parsed_data, value, register_addr, self.r2119_bits, "R2119")
+
+    def _parse_status_bits(self, parsed_data: dict, value: int, register_addr: int,
                           bit_mappings: dict, prefix: str):
         """Helper method to parse status bits"""
         for bit_num, bit_info in bit_mappings.items():
@@ -373,9 +689,25 @@ class QuattDataParser:
                 "unit": "",
                 "device_class": "binary_sensor",
                 "register": f"{register_addr}b{bit_num}",
-                "raw_value": value
+                "raw_value": value,
+                "key": bit_info["key"]
             }
 
+class SnifferStats:
+    """Frame and publish counters incremented in the per-frame hot path"""
+    __slots__ = ('total_frames', 'valid_frames', 'requests', 'responses',
+                 'errors', 'mqtt_publishes')
+
+    def __init__(self, total_frames: int = 0, valid_frames: int = 0,
+                 requests: int = 0, responses: int = 0, errors: int = 0,
+                 mqtt_publishes: int = 0):
+        self.total_frames = total_frames
+        self.valid_frames = valid_frames
+        self.requests = requests
+        self.responses = responses
+        self.errors = errors
+        self.mqtt_publishes = mqtt_publishes
+
 class QuattModbusSniffer:
     """
     Enhanced Quatt Modbus sniffer with Home Assistant integration.
@@ -387,6 +719,7 @@ class QuattModbusSniffer:
         self.host = host
         self.port = port
         self.running = False
+        self.server_socket = None
         
         # Initialize MQTT integration
         self.mqtt = HomeAssistantMQTT(
@@ -402,22 +735,21 @@ class QuattModbusSniffer:
         self.data_parser = QuattDataParser()
         
         # Statistics and tracking
-        self.stats = {
-            'total_frames': 0,
-            'valid_frames': 0,
-            'requests': 0,
-            'responses': 0,
-            'errors': 0,
-            'mqtt_publishes': 0
-        }
+        self.stats = SnifferStats()
         
-        # Per-slave statistics
-        self.slave_stats = {}
+        # Per-slave statistics; missing slaves get a zeroed counter dict
+        self.slave_stats = defaultdict(_new_slave_stats)
         
         # Track discovered slaves for HA setup
         self.discovered_slaves = set()
         
-        self.pending_requests = {}
+        # Pending request per slave, indexed by device ID (one byte on the
+        # wire, so 256 slots); each entry is (frame, time, function_code)
+        self.pending_requests = [None] * 256
+
+        # Timestamp formatting cache (strftime of the current second)
+        self._ts_cache_sec = -1
+        self._ts_cache_str = ''
         
         # Sensors will be auto-discovered when each heat pump is first seen
     
@@ -453,9 +785,10 @@ class QuattModbusSniffer:
         for bit_info in self.data_parser.r2119_bits.values():
             self.mqtt.publish_binary_sensor_discovery(f"R2119 {bit_info['name']}", slave_id)
         
-        # General stats sensors (per heat pump)
-        self.mqtt.publish_sensor_discovery("Communication Quality", slave_id, "%", None, "mdi:signal")
-        self.mqtt.publish_sensor_discovery("Total Frames", slave_id, "", None, "mdi:counter")
+        # General stats sensors (per heat pump); quality and frame counters
+        # are published on their own topics outside the response hot path
+        self.mqtt.publish_sensor_discovery("Communication Quality", slave_id, "%", None, "mdi:signal", bundled=False)
+        self.mqtt.publish_sensor_discovery("Total Frames", slave_id, "", None, "mdi:counter", bundled=False)
         self.mqtt.publish_sensor_discovery("Response Time", slave_id, "ms", None, "mdi:timer")
         
         logger.info(f"✅ Home Assistant setup complete for Heat Pump {slave_id:02X}")
@@ -532,81 +865,197 @@ class QuattModbusSniffer:
             self.stop_server()
     
     def handle_client(self, client_socket, client_address):
-        """Handle data from connected client with MQTT publishing"""
-        buffer = b''
-        
+        """Handle data from connected client with MQTT publishing
+
+        Receives directly into a fixed buffer with recv_into, so the ingest
+        path allocates nothing per recv; frames are parsed in place between
+        a read and a write cursor.
+        """
+        recv_buf = bytearray(RECV_BUFFER_SIZE)
+        recv_view = memoryview(recv_buf)
+        read_pos = 0
+        write_pos = 0
+
         try:
             while self.running:
-                data = client_socket.recv(1024)
-                if not data:
+                received = client_socket.recv_into(recv_view[write_pos:])
+                if not received:
                     break
-                    
-                buffer += data
-                buffer = self.extract_frames(buffer)
-                
+
+                write_pos += received
+                read_pos = self.extract_frames(recv_buf, read_pos, write_pos)
+
+                # Shift unconsumed bytes down once the write cursor nears
+                # the end of the buffer
+                if RECV_BUFFER_SIZE - write_pos < RECV_CHUNK_SIZE:
+                    recv_buf[:write_pos - read_pos] = recv_buf[read_pos:write_pos]
+                    write_pos -= read_pos
+                    read_pos = 0
+
         except Exception as e:
             logger.error(f"Error handling client {client_address}: {e}")
         finally:
             client_socket.close()
             logger.info(f"📡 Client disconnected: {client_address}")
     
-    def extract_frames(self, buffer):
-        """Extract Modbus frames with CRC validation using optimized sliding window"""
-        while len(buffer) >= MIN_FRAME_SIZE:
-            frame_found = False
-            
-            # Use sliding window to find valid frames
-            for start_pos in range(len(buffer) - 3):  # Ensure at least 4 bytes remain
-                remaining = buffer[start_pos:]
-                
-                # Try different frame lengths
-                for frame_len in range(MIN_FRAME_SIZE, min(len(remaining) + 1, MAX_FRAME_SIZE)):
-                    potential_frame = remaining[:frame_len]
-                    
-                    if self.verify_crc(potential_frame):
-                        self.process_frame(potential_frame)
-                        # Remove processed frame and continue with remaining buffer
-                        buffer = buffer[start_pos + frame_len:]
+    def _candidate_frame_lens(self, buffer):
+        """Get the possible frame lengths for a frame starting at buffer[0]
+
+        Decodes the function code to predict the exact expected lengths
+        (request and response shapes) instead of brute-forcing every length.
+        """
+        function_code = buffer[1]
+
+        # Exception responses: address + function + error code + CRC
+        if function_code & 0x80:
+            return (5,)
+
+        # Read functions: 8-byte request or 3 + byte_count + 2 response
+        if function_code in _READ_FUNCTION_CODES:
+            return (8, 3 + buffer[2] + 2) if len(buffer) >= 3 else (8,)
+
+        # Write single register: request and echo response are both 8 bytes
+        if function_code == 0x06:
+            return (8,)
+
+        # Write multiple registers: 9 + byte_count request or 8-byte response
+        if function_code == 0x10:
+            return (8, 9 + buffer[6]) if len(buffer) >= 7 else (8,)
+
+        return ()  # Unknown function code, resync
+
+    def extract_frames(self, buffer, read_pos=0, end=None):
+        """Extract Modbus frames with CRC validation using function-code-aware parsing
+
+        Operates on a memoryview over the receive buffer between read_pos
+        and end, advancing a read position instead of reslicing the buffer,
+        so consuming a frame is O(1). Returns the new read position; the
+        caller compacts the buffer.
+        """
+        if end is None:
+            end = len(buffer)
+        with memoryview(buffer) as view:
+            while end - read_pos >= MIN_FRAME_SIZE:
+                frame_found = False
+                need_more_data = False
+                remaining = view[read_pos:end]
+
+                # Validate CRC only at the lengths the function code allows
+                for frame_len in self._candidate_frame_lens(remaining):
+                    if frame_len < MIN_FRAME_SIZE or frame_len > MAX_FRAME_SIZE:
+                        continue
+
+                    if frame_len > len(remaining):
+                        need_more_data = True
+                        continue
+
+                    if self.verify_crc(view, read_pos, read_pos + frame_len):
+                        # Materialize only confirmed frames (they outlive the buffer)
+                        self.process_frame(bytes(view[read_pos:read_pos + frame_len]))
+                        read_pos += frame_len
                         frame_found = True
                         break
-                
+
                 if frame_found:
-                    break
-            
-            if not frame_found:
-                # No valid frame found, discard old data if buffer is too large
-                if len(buffer) > MAX_BUFFER_SIZE:
-                    buffer = buffer[BUFFER_CLEANUP_SIZE:]  # Keep only recent data
-                else:
+                    continue
+
+                if need_more_data and end - read_pos <= MAX_BUFFER_SIZE:
                     break  # Wait for more data
-                
-        return buffer
+
+                # Large garbage buffer (e.g. after a reconnect): scan all start
+                # positions at once instead of shifting byte by byte
+                if NUMPY_AVAILABLE and end - read_pos > MAX_BUFFER_SIZE:
+                    offset = self._find_valid_frame_offset(remaining, 8)
+                    if offset > 0:
+                        read_pos += offset
+                        continue
+                    if offset < 0:
+                        # Nothing valid anywhere in the scanned region: drop
+                        # it in one step, keeping a MAX_FRAME_SIZE tail for a
+                        # frame that straddles into the next recv. Advancing
+                        # a byte at a time would rerun the full scan per byte.
+                        read_pos = end - MAX_FRAME_SIZE
+                        continue
+
+                # No valid frame at this position, shift one byte to resync
+                read_pos += 1
+
+        return read_pos
+
+    def _find_valid_frame_offset(self, buffer, frame_len):
+        """Vectorized scan for a CRC-valid frame of a fixed length
+
+        Runs the table-driven CRC over every start position in parallel
+        using NumPy and returns the first offset whose trailing two bytes
+        match, or -1 if none do.
+        """
+        arr = np.frombuffer(bytes(buffer), dtype=np.uint8)
+        if arr.size < frame_len:
+            return -1
+
+        windows = np.lib.stride_tricks.sliding_window_view(arr, frame_len)
+        crc = np.full(windows.shape[0], MODBUS_CRC_INIT, dtype=np.uint16)
+        table = CRC16_TABLE_NP
+        for i in range(frame_len - 2):
+            crc = (crc >> 8) ^ table[(crc ^ windows[:, i]) & 0xFF]
+
+        received = (windows[:, frame_len - 2].astype(np.uint16) |
+                    (windows[:, frame_len - 1].astype(np.uint16) << 8))
+        matches = np.nonzero(crc == received)[0]
+        return int(matches[0]) if matches.size else -1
     
-    def verify_crc(self, frame):
-        """Verify Modbus CRC"""
-        if len(frame) < MIN_FRAME_SIZE:
+    def verify_crc(self, frame, start=0, end=None):
+        """Verify the Modbus CRC of frame[start:end] without slicing"""
+        if end is None:
+            end = len(frame)
+        if end - start < MIN_FRAME_SIZE:
             return False
-        data = frame[:-2]
-        received_crc = frame[-2:]
-        calculated_crc = self.calculate_crc(data)
-        return received_crc == calculated_crc
+        received_crc = frame[end - 2] | (frame[end - 1] << 8)
+        return received_crc == self.calculate_crc(frame, start, end - 2)
     
-    def calculate_crc(self, data):
-        """Calculate Modbus CRC16"""
-        crc = MODBUS_CRC_INIT
-        for byte in data:
-            crc ^= byte
-            for _ in range(8):
-                if crc & 0x0001:
-                    crc = (crc >> 1) ^ MODBUS_CRC_POLY
-                else:
-                    crc >>= 1
-        return struct.pack('<H', crc)
+    def calculate_crc(self, data, start=0, end=None):
+        """Calculate Modbus CRC16 over data[start:end] using the precomputed lookup table
+
+        Returns the raw 16-bit CRC value (little-endian on the wire).
+        """
+        if end is None:
+            end = len(data)
+        if SNIFFER_CORE_AVAILABLE:
+            # Compiled extension: plain C loop, no array wrapping needed
+            crc = _sniffer_core.crc16(data, start, end)
+        elif NUMBA_AVAILABLE:
+            crc = int(_crc16_modbus(np.frombuffer(data, dtype=np.uint8)[start:end]))
+        elif USE_NIBBLE_CRC_TABLE:
+            crc = MODBUS_CRC_INIT
+            table = CRC16_NIBBLE_TABLE
+            for i in range(start, end):
+                crc ^= data[i]
+                crc = (crc >> 4) ^ table[crc & 0xF]
+                crc = (crc >> 4) ^ table[crc & 0xF]
+        else:
+            crc = MODBUS_CRC_INIT
+            table = CRC16_TABLE
+            for i in range(start, end):
+                crc = (crc >> 8) ^ table[(crc ^ data[i]) & 0xFF]
+        return crc
     
+    def _format_timestamp(self, current_time):
+        """Format a frame timestamp with millisecond precision
+
+        time.strftime is much faster than datetime.strftime and the result
+        only changes once per second, so the formatted second is cached and
+        only the millisecond suffix is rebuilt per frame.
+        """
+        second = int(current_time)
+        if second != self._ts_cache_sec:
+            self._ts_cache_sec = second
+            self._ts_cache_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+        return f"{self._ts_cache_str}.{int((current_time - second) * 1000):03d}"
+
     def process_frame(self, frame_data):
         """Process frame and publish to MQTT"""
         try:
-            self.stats['total_frames'] += 1
+            self.stats.total_frames += 1
             
             if len(frame_data) < MIN_FRAME_SIZE:
                 return
@@ -614,50 +1063,52 @@ class QuattModbusSniffer:
             device_id = frame_data[0]
             function_code = frame_data[1]
             current_time = time.time()
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-            
+            log_frames = logger.isEnabledFor(logging.INFO)
+
+            # One slave_stats lookup per frame; the counters below bump the
+            # fetched dict directly
+            slave = self.slave_stats[device_id]
+
             is_request = self.is_modbus_request(function_code, frame_data)
-            
+
             if is_request:
-                self.stats['requests'] += 1
-                self.update_slave_stats(device_id, 'requests')
-                self.pending_requests[device_id] = {
-                    'frame': frame_data,
-                    'time': current_time,
-                    'function_code': function_code
-                }
-                
-                request_info = self.parse_request(frame_data)
-                logger.info(f"[{timestamp}] 📤 REQUEST  | Device: {device_id:02X} | {request_info}")
-                
+                self.stats.requests += 1
+                slave['requests'] += 1
+                self.pending_requests[device_id] = (frame_data, current_time, function_code)
+
+                if log_frames:
+                    request_info = self.parse_request(frame_data)
+                    logger.info(f"[{self._format_timestamp(current_time)}] 📤 REQUEST  | Device: {device_id:02X} | {request_info}")
+
             else:
-                self.stats['responses'] += 1
-                self.update_slave_stats(device_id, 'responses')
+                self.stats.responses += 1
+                slave['responses'] += 1
                 response_time_ms = 0
                 
-                if device_id in self.pending_requests:
-                    request_time = self.pending_requests[device_id]['time']
+                pending = self.pending_requests[device_id]
+                if pending is not None:
+                    self.pending_requests[device_id] = None
+                    request_frame, request_time, _ = pending
                     response_time_ms = (current_time - request_time) * 1000
-                    request_frame = self.pending_requests[device_id]['frame']
-                    del self.pending_requests[device_id]
                 else:
                     request_frame = None
                 
-                response_info = self.parse_response(frame_data, request_frame)
-                logger.info(f"[{timestamp}] 📥 RESPONSE | Device: {device_id:02X} | {response_info} | ⏱️ {response_time_ms:.1f}ms")
+                if log_frames:
+                    response_info = self.parse_response(frame_data, request_frame)
+                    logger.info(f"[{self._format_timestamp(current_time)}] 📥 RESPONSE | Device: {device_id:02X} | {response_info} | ⏱️ {response_time_ms:.1f}ms")
                 
                 # Parse and publish sensor data for read responses
                 self.handle_sensor_data(frame_data, request_frame, device_id, response_time_ms)
             
-            self.stats['valid_frames'] += 1
-            self.update_slave_stats(device_id, 'valid_frames')
+            self.stats.valid_frames += 1
+            slave['valid_frames'] += 1
             
             # Publish stats periodically
-            if self.stats['total_frames'] % STATS_PUBLISH_INTERVAL == 0:
+            if self.stats.total_frames % STATS_PUBLISH_INTERVAL == 0:
                 self.publish_stats()
                 
         except Exception as e:
-            self.stats['errors'] += 1
+            self.stats.errors += 1
             logger.error(f"❌ Error processing frame: {e}")
     
     def handle_sensor_data(self, response_frame, request_frame, device_id, response_time):
@@ -667,38 +1118,42 @@ class QuattModbusSniffer:
         
         try:
             # Extract start register from request
-            start_register = struct.unpack('>H', request_frame[2:4])[0]
+            start_register = _u16(request_frame, 2)[0]
             
-            # Extract values from response
+            # Extract values from response: one bounds check, then unpack
+            # all 16-bit registers in a single C-level call
             byte_count = response_frame[2]
-            values = []
-            
-            # Process values in pairs (16-bit registers)
-            for i in range(0, byte_count, 2):
-                if 3 + i + 1 < len(response_frame) - 2:  # Ensure we don't read past frame
-                    val = struct.unpack('>H', response_frame[3 + i:5 + i])[0]
-                    values.append(val)
+            num_registers = min(byte_count >> 1, max(0, (len(response_frame) - 5) >> 1))
+            if not num_registers:
+                values = []
+            elif NUMPY_AVAILABLE:
+                # One memcpy + byteswap, no per-register unpack or list build
+                values = np.frombuffer(response_frame, dtype='>u2', count=num_registers, offset=3)
+            else:
+                values = list(_unpack_regs(response_frame, 3, num_registers))
             
-            # Setup HA sensors for this slave if not already done
-            self.setup_ha_sensors_for_slave(device_id)
+            # Setup HA sensors for this slave if not already done; inline
+            # membership check skips the call entirely on every later frame
+            if device_id not in self.discovered_slaves:
+                self.setup_ha_sensors_for_slave(device_id)
             
             # Parse known sensors
             parsed_data = self.data_parser.parse_read_response(start_register, values)
-            
-            # Publish to Home Assistant with slave ID
+
+            # Collect the whole batch into one JSON payload per slave
+            payload = {}
             for sensor_name, sensor_data in parsed_data.items():
-                if sensor_data.get("device_class") == "binary_sensor":
-                    self.mqtt.publish_binary_sensor_data(sensor_name, device_id, sensor_data["value"])
-                else:
-                    self.mqtt.publish_sensor_data(sensor_name, device_id, sensor_data["value"])
-                
-                self.stats['mqtt_publishes'] += 1
-                self.update_slave_stats(device_id, 'mqtt_publishes')
-                
-                logger.debug(f"🏠 Published {sensor_name}: {sensor_data['value']} {sensor_data.get('unit', '')} (device {device_id:02X})")
-            
-            # Publish response time for this specific heat pump
-            self.mqtt.publish_sensor_data("Response Time", device_id, round(response_time, 1))
+                payload[sensor_data["key"]] = sensor_data["value"]
+                logger.debug("🏠 Published %s: %s %s (device %02X)",
+                             sensor_name, sensor_data["value"], sensor_data.get("unit", ""), device_id)
+
+            # Include response time for this specific heat pump; one decimal
+            # via integer arithmetic, cheaper than round() and always >= 0
+            payload["response_time"] = int(response_time * 10 + 0.5) / 10.0
+
+            self.mqtt.publish_sensor_bundle(device_id, payload)
+            self.stats.mqtt_publishes += 1
+            self.update_slave_stats(device_id, 'mqtt_publishes')
             
         except Exception as e:
             logger.error(f"Error publishing sensor data for device {device_id:02X}: {e}")
@@ -709,40 +1164,39 @@ class QuattModbusSniffer:
             return
         
         # Calculate overall communication quality
-        quality = (self.stats['valid_frames'] / max(self.stats['total_frames'], 1)) * 100
+        stats = self.stats
+        quality = (stats.valid_frames / max(stats.total_frames, 1)) * 100
         
-        # Publish per-slave statistics
+        # Collect per-slave statistics and hand them to paho in one batch
+        messages = []
+        discovered = self.discovered_slaves
+        topic_for = self.mqtt._sensor_state_topic
         for slave_id, slave_stats in self.slave_stats.items():
-            if slave_id in self.discovered_slaves:
-                slave_quality = (slave_stats['valid_frames'] / max(slave_stats['valid_frames'] + slave_stats.get('errors', 0), 1)) * 100
-                self.mqtt.publish_sensor_data("Communication Quality", slave_id, round(slave_quality, 1))
-                self.mqtt.publish_sensor_data("Total Frames", slave_id, slave_stats['valid_frames'])
+            if slave_id not in discovered:
+                continue
+            valid_frames = slave_stats['valid_frames']
+            slave_quality = valid_frames / max(valid_frames + slave_stats.get('errors', 0), 1) * 100
+            messages.append((topic_for("Communication Quality", slave_id), "%.1f" % slave_quality, 0, False))
+            messages.append((topic_for("Total Frames", slave_id), str(valid_frames), 0, False))
+        if messages:
+            self.mqtt.publish_batch(messages)
         
-        logger.info(f"📊 OVERALL STATS | Total: {self.stats['total_frames']} | "
-                   f"Valid: {self.stats['valid_frames']} | "
-                   f"MQTT: {self.stats['mqtt_publishes']} | "
-                   f"Quality: {quality:.1f}%")
+        logger.info("📊 OVERALL STATS | Total: %d | Valid: %d | MQTT: %d | Quality: %.1f%%",
+                    stats.total_frames, stats.valid_frames, stats.mqtt_publishes, quality)
         
-        # Log per-slave stats
-        for slave_id, slave_stats in self.slave_stats.items():
-            logger.info(f"📊 HP{slave_id:02X} | Frames: {slave_stats['valid_frames']} | "
-                       f"Reqs: {slave_stats['requests']} | Resp: {slave_stats['responses']} | "
-                       f"MQTT: {slave_stats['mqtt_publishes']}")
+        # Log per-slave stats as a single record instead of one per slave,
+        # so the handler (and its I/O) runs once per stats cycle
+        if self.slave_stats:
+            logger.info("\n".join(
+                "📊 HP%02X | Frames: %d | Reqs: %d | Resp: %d | MQTT: %d" % (
+                    slave_id, slave_stats['valid_frames'], slave_stats['requests'],
+                    slave_stats['responses'], slave_stats['mqtt_publishes'])
+                for slave_id, slave_stats in self.slave_stats.items()))
     
     # Parsing methods
     
     def update_slave_stats(self, slave_id: int, stat_type: str):
         """Update statistics for a specific slave"""
-        if slave_id not in self.slave_stats:
-            self.slave_stats[slave_id] = {
-                'total_frames': 0,
-                'valid_frames': 0,
-                'requests': 0,
-                'responses': 0,
-                'errors': 0,
-                'mqtt_publishes': 0
-            }
-        
         self.slave_stats[slave_id][stat_type] += 1
     
     def is_modbus_request(self, function_code, frame_data):
@@ -752,7 +1206,7 @@ class QuattModbusSniffer:
             return False
             
         # Read functions: requests are typically 8 bytes
-        if function_code in [0x01, 0x02, 0x03, 0x04]:
+        if function_code in _READ_FUNCTION_CODES:
             return len(frame_data) <= 8
             
         # Write functions
@@ -768,16 +1222,13 @@ class QuattModbusSniffer:
         function_code = frame_data[1]
         try:
             if function_code == 0x03:
-                start_addr = struct.unpack('>H', frame_data[2:4])[0]
-                count = struct.unpack('>H', frame_data[4:6])[0]
+                start_addr, count = _unpack_regs(frame_data, 2, 2)
                 return f"📖 Read Holding Registers | Start: {start_addr} (0x{start_addr:04X}) | Count: {count}"
             elif function_code == 0x04:
-                start_addr = struct.unpack('>H', frame_data[2:4])[0]
-                count = struct.unpack('>H', frame_data[4:6])[0]
+                start_addr, count = _unpack_regs(frame_data, 2, 2)
                 return f"📊 Read Input Registers | Start: {start_addr} (0x{start_addr:04X}) | Count: {count}"
             elif function_code == 0x06:
-                addr = struct.unpack('>H', frame_data[2:4])[0]
-                value = struct.unpack('>H', frame_data[4:6])[0]
+                addr, value = _unpack_regs(frame_data, 2, 2)
                 return f"✏️ Write Single Register | Addr: {addr} (0x{addr:04X}) | Value: {value}"
             else:
                 return f"🔧 Function 0x{function_code:02X}"
@@ -793,11 +1244,8 @@ class QuattModbusSniffer:
                 return f"❌ ERROR Response | Function: 0x{function_code & 0x7F:02X} | Code: {error_code:02X}"
             elif function_code in [0x03, 0x04]:
                 byte_count = frame_data[2]
-                values = []
-                for i in range(0, byte_count, 2):
-                    if 3 + i + 1 < len(frame_data) - 2:
-                        val = struct.unpack('>H', frame_data[3 + i:5 + i])[0]
-                        values.append(str(val))
+                num_values = min(byte_count >> 1, max(0, (len(frame_data) - 5) >> 1))
+                values = [str(val) for val in _unpack_regs(frame_data, 3, num_values)]
                 return f"📖 Read Response | Bytes: {byte_count} | Values: [{', '.join(values[:8])}{'...' if len(values) > 8 else ''}]"
             else:
                 return f"🔧 Function 0x{function_code:02X} Response"
@@ -810,7 +1258,7 @@ class QuattModbusSniffer:
         self.running = False
         
         # Close server socket
-        if hasattr(self, 'server_socket'):
+        if self.server_socket is not None:
             try:
                 self.server_socket.close()
                 logger.info("📡 Server socket closed")
@@ -828,36 +1276,39 @@ class QuattModbusSniffer:
         
         logger.info("🔴 Quatt Modbus Sniffer Server stopped")
 
+# Built-in configuration defaults; load_config_file copies sections before
+# handing them out so callers can't mutate these
+_CONFIG_DEFAULTS = {
+    'server': {
+        'host': 'localhost',
+        'port': '4444'
+    },
+    'mqtt': {
+        'broker_host': 'localhost',
+        'broker_port': '1883',
+        'username': '',
+        'password': '',
+        'device_prefix': 'quatt'
+    },
+    'devices': {
+        'device_base_name': 'Quatt Heat Pump'
+    }
+}
+
 def load_config_file(config_path: str = "config.ini") -> dict:
     """Load configuration from INI file"""
     config = configparser.ConfigParser()
-    defaults = {
-        'server': {
-            'host': 'localhost',
-            'port': '4444'
-        },
-        'mqtt': {
-            'broker_host': 'localhost',
-            'broker_port': '1883',
-            'username': '',
-            'password': '',
-            'device_prefix': 'quatt'
-        },
-        'devices': {
-            'device_base_name': 'Quatt Heat Pump'
-        }
-    }
-    
+
     if os.path.exists(config_path):
         config.read(config_path)
         logger.info(f"📋 Loaded configuration from {config_path}")
     else:
         logger.warning(f"⚠️ Config file {config_path} not found, using defaults")
-        return defaults
-    
+        return {name: section.copy() for name, section in _CONFIG_DEFAULTS.items()}
+
     # Merge with defaults
     result = {}
-    for section_name, section_defaults in defaults.items():
+    for section_name, section_defaults in _CONFIG_DEFAULTS.items():
         result[section_name] = section_defaults.copy()
         if config.has_section(section_name):
             for key, value in config[section_name].items():
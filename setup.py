@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""Build script for the optional _sniffer_core Cython extension.
+
+The sniffer itself is a plain Python script and runs without this; build
+the extension only if you want the compiled CRC path:
+
+    pip install cython
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="quatt-modbus-sniffer",
+    ext_modules=cythonize("_sniffer_core.pyx"),
+)